@@ -1,10 +1,10 @@
+import json
+
 from fastapi import APIRouter, Request, HTTPException
-from langchain_core.messages import AIMessage
+from fastapi.responses import StreamingResponse
+from langchain_core.messages import AIMessage, HumanMessage
 from pydantic import BaseModel
 
-from ronnyx.api.deps import apply_user_message, get_state, set_state
-from ronnyx.core.agent import AgentState
-
 router = APIRouter()
 
 
@@ -18,20 +18,23 @@ class ChatResponse(BaseModel):
     reply: str
 
 
-@router.get("/tools")
+class ToolsResponse(BaseModel):
+    tools: list[str]
+
+
+@router.get("/tools", response_model=ToolsResponse)
 async def list_tools(request: Request):
-    return {"tools": request.app.state.tool_names}
+    return ToolsResponse(tools=request.app.state.tool_names)
 
 
 @router.post("/chat", response_model=ChatResponse)
 async def chat(req: ChatRequest, request: Request):
     graph = request.app.state.graph
-    sessions = request.app.state.sessions
 
-    state: AgentState = get_state(req.session_id, sessions)
-    state = apply_user_message(state, req.message)
-    new_state = await graph.ainvoke(state)
-    set_state(req.session_id, new_state, sessions)
+    new_state = await graph.ainvoke(
+        {"messages": [HumanMessage(content=req.message)]},
+        config={"configurable": {"thread_id": req.session_id}},
+    )
 
     reply = next(
         (
@@ -49,3 +52,24 @@ async def chat(req: ChatRequest, request: Request):
         )
 
     return ChatResponse(session_id=req.session_id, reply=reply)
+
+
+@router.post("/chat/stream")
+async def chat_stream(req: ChatRequest, request: Request):
+    graph = request.app.state.graph
+
+    async def event_stream():
+        events = graph.astream_events(
+            {"messages": [HumanMessage(content=req.message)]},
+            config={"configurable": {"thread_id": req.session_id}},
+            version="v2",
+        )
+        async for event in events:
+            if event["event"] != "on_chat_model_stream":
+                continue
+            delta = event["data"]["chunk"].content
+            if delta:
+                yield f"data: {json.dumps({'delta': delta})}\n\n"
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
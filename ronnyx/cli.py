@@ -3,6 +3,8 @@ import os
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 DEFAULT_BASE_URL = "http://127.0.0.1:8000/api/chat"
 DEFAULT_SESSION_ID = "1"
@@ -17,11 +19,32 @@ BANNER = r"""
 """
 
 
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    # POST /api/chat is not idempotent: a gateway 504 or read timeout can
+    # arrive after the server has already appended the turn and run tools, so
+    # an automatic re-send would duplicate both. Only GET gets read/status
+    # retries; POST is retried solely on connect errors (nothing was sent).
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=["GET"],
+    )
+    adapter = HTTPAdapter(max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 def chat_loop(base_url: str, session_id: str) -> None:
     print(BANNER)
     print(f"Connected to {base_url} (session: {session_id})")
     print("Type 'exit' or 'quit' to leave. Use '/tools' to list available tools.\n")
 
+    http = _build_session()
+    tools_url = base_url.replace("/api/chat", "/api/tools")
+
     while True:
         try:
             message = input("You > ").strip()
@@ -36,9 +59,8 @@ def chat_loop(base_url: str, session_id: str) -> None:
             break
 
         if message.lower() == "/tools":
-            tools_url = base_url.replace("/api/chat", "/api/tools")
             try:
-                response = requests.get(tools_url, timeout=30)
+                response = http.get(tools_url, timeout=30)
                 response.raise_for_status()
                 tools = response.json()
                 if tools:
@@ -53,7 +75,7 @@ def chat_loop(base_url: str, session_id: str) -> None:
             continue
 
         try:
-            response = requests.post(
+            response = http.post(
                 base_url,
                 json={"session_id": session_id, "message": message},
                 timeout=120,
@@ -61,6 +83,10 @@ def chat_loop(base_url: str, session_id: str) -> None:
             response.raise_for_status()
         except requests.RequestException as exc:
             print(f"[error] request failed: {exc}")
+            print(
+                "[warning] the message was not re-sent automatically; "
+                "the server may still have processed it."
+            )
             continue
 
         try:
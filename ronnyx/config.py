@@ -1,4 +1,6 @@
+import functools
 import importlib
+import inspect
 import logging
 import os
 import re
@@ -10,9 +12,11 @@ from langchain_core.tools import StructuredTool
 
 logger = logging.getLogger("ronnyx")
 
+_ENV_VAR_RE = re.compile(r"\$\{(\w+)\}")
+
 
 def _resolve(value: str) -> str:
-    return re.sub(r"\$\{(\w+)\}", lambda m: os.environ.get(m.group(1), ""), value)
+    return _ENV_VAR_RE.sub(lambda m: os.environ.get(m.group(1), ""), value)
 
 
 def _resolve_recursive(obj):
@@ -45,6 +49,8 @@ class RonnyxConfig:
         self.llm_api_key: str = llm.get("api_key") or os.environ.get(
             "OPENAI_API_KEY", ""
         )
+        self.llm_max_history_tokens: int = int(llm.get("max_history_tokens") or 0)
+        self.llm_cache_replies: bool = bool(llm.get("cache_replies", False))
 
         if not self.llm_api_key:
             raise ValueError(
@@ -87,8 +93,10 @@ class RonnyxConfig:
                 if isinstance(func, StructuredTool):
                     tools.append(func)
                 elif callable(func):
+                    is_async = inspect.iscoroutinefunction(func)
                     tool = StructuredTool.from_function(
-                        func=func,
+                        func=None if is_async else func,
+                        coroutine=func if is_async else None,
                         name=entry.get("name", func_name),
                         description=entry.get("description", func.__doc__ or ""),
                     )
@@ -98,5 +106,7 @@ class RonnyxConfig:
         return tools
 
 
+@functools.cache
 def load_config(path: str = "ronnyx.yaml") -> RonnyxConfig:
+    """Load and cache the config; env and YAML are read once per path."""
     return RonnyxConfig(path)
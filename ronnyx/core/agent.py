@@ -1,8 +1,18 @@
+import asyncio
+import hashlib
 import logging
+from collections import OrderedDict
 from typing import Annotated, Sequence, TypedDict
 
-from langchain_core.messages import BaseMessage, SystemMessage, ToolMessage
+from langchain_core.messages import (
+    BaseMessage,
+    SystemMessage,
+    ToolMessage,
+    trim_messages,
+)
+from langchain_core.messages.utils import count_tokens_approximately
 from langchain_openai import ChatOpenAI
+from langgraph.checkpoint.memory import InMemorySaver
 from langgraph.graph import END, StateGraph
 from langgraph.graph.message import add_messages
 
@@ -15,39 +25,123 @@ class AgentState(TypedDict):
     messages: Annotated[Sequence[BaseMessage], add_messages]
 
 
-def build_graph(tools: list, config):
-    tool_map = {t.name: t for t in tools}
-    llm = ChatOpenAI(
+_REPLY_CACHE_MAX = 256
+
+
+def _make_llm(config, tools: list):
+    """Build the tool-bound chat model. Single seam for tests to patch."""
+    return ChatOpenAI(
         model=config.llm_model, temperature=0, api_key=config.llm_api_key
     ).bind_tools(tools)
 
+
+async def _run_tool_call(tool_map: dict, tc: dict) -> ToolMessage:
+    tool = tool_map.get(tc["name"])
+    if tool is None:
+        content = f"Tool '{tc['name']}' not found."
+    else:
+        try:
+            content = await tool.ainvoke(tc["args"])
+        except Exception as e:
+            logger.warning("Tool %s failed: %s", tc["name"], e)
+            content = f"Tool error: {e}"
+    return ToolMessage(content=str(content), tool_call_id=tc["id"])
+
+
+def build_graph(tools: list, config):
+    tool_map = {t.name: t for t in tools}
+    llm = _make_llm(config, tools)
+
     context_parts = config.build_context()
     system_prompt = SYSTEM_PROMPT + context_parts if context_parts else SYSTEM_PROMPT
 
+    max_history_tokens = getattr(config, "llm_max_history_tokens", 0)
+    cache_replies = getattr(config, "llm_cache_replies", False)
+
+    # One SystemMessage for the graph's lifetime: the prompt is static, and a
+    # byte-identical prefix is what lets provider-side prompt caches hit.
+    system = SystemMessage(content=system_prompt)
+
+    # Exact-match reply cache, keyed on model + prompt + tool set + transcript.
+    # Only tool-free turns are cached; anything involving tool output is live
+    # data and must not be replayed.
+    reply_cache: OrderedDict[str, BaseMessage] = OrderedDict()
+    tools_signature = ",".join(sorted(tool_map))
+
+    def _cache_key(messages: list) -> str:
+        h = hashlib.sha256()
+        for part in (config.llm_model, system_prompt, tools_signature):
+            h.update(part.encode())
+            h.update(b"\x00")
+        for m in messages:
+            h.update(m.type.encode())
+            h.update(b"\x00")
+            h.update(str(m.content).encode())
+            h.update(b"\x00")
+        return h.hexdigest()
+
     async def call_llm(state: AgentState) -> AgentState:
-        system = SystemMessage(content=system_prompt)
-        response = await llm.ainvoke([system] + list(state["messages"]))
+        messages = list(state["messages"])
+        if max_history_tokens:
+            trimmed = trim_messages(
+                messages,
+                max_tokens=max_history_tokens,
+                token_counter=count_tokens_approximately,
+                strategy="last",
+                include_system=False,
+                start_on="human",
+                allow_partial=False,
+            )
+            # When the current turn alone exceeds the budget, trim_messages
+            # returns [] (or a window without it). Sending the over-long turn
+            # beats silently answering an empty transcript, so fall back to
+            # everything from the last human message onward.
+            if not trimmed or trimmed[-1] is not messages[-1]:
+                start = next(
+                    (
+                        i
+                        for i in range(len(messages) - 1, -1, -1)
+                        if messages[i].type == "human"
+                    ),
+                    0,
+                )
+                trimmed = messages[start:]
+            messages = trimmed
+
+        key = None
+        # Defensive: an empty window must never be cached or served — every
+        # empty transcript would hash to the same key and cross-serve replies.
+        if (
+            cache_replies
+            and messages
+            and not any(isinstance(m, ToolMessage) for m in messages)
+        ):
+            key = _cache_key(messages)
+            cached = reply_cache.get(key)
+            if cached is not None:
+                reply_cache.move_to_end(key)
+                # Fresh id so add_messages appends instead of updating the
+                # original message in threads that already contain it.
+                return {"messages": [cached.model_copy(update={"id": None})]}
+
+        response = await llm.ainvoke([system] + messages)
+
+        if key is not None and not getattr(response, "tool_calls", None):
+            reply_cache[key] = response
+            if len(reply_cache) > _REPLY_CACHE_MAX:
+                reply_cache.popitem(last=False)
         return {"messages": [response]}
 
     async def execute_tools(state: AgentState) -> AgentState:
         last = state["messages"][-1]
-        results = []
-        for tc in last.tool_calls:
-            tool = tool_map.get(tc["name"])
-            if tool is None:
-                content = f"Tool '{tc['name']}' not found."
-            else:
-                try:
-                    content = await tool.ainvoke(tc["args"])
-                except Exception as e:
-                    logger.warning("Tool %s failed: %s", tc["name"], e)
-                    content = f"Tool error: {e}"
-            results.append(ToolMessage(content=str(content), tool_call_id=tc["id"]))
-        return {"messages": results}
+        results = await asyncio.gather(
+            *(_run_tool_call(tool_map, tc) for tc in last.tool_calls)
+        )
+        return {"messages": list(results)}
 
     def should_continue(state: AgentState) -> str:
-        last = state["messages"][-1]
-        return "continue" if getattr(last, "tool_calls", None) else "end"
+        msgs = state["messages"]
+        return "continue" if msgs and getattr(msgs[-1], "tool_calls", None) else "end"
 
     graph = StateGraph(AgentState)
     graph.add_node("agent", call_llm)
@@ -59,4 +153,4 @@ def build_graph(tools: list, config):
         {"continue": "tools", "end": END},
     )
     graph.add_edge("tools", "agent")
-    return graph.compile()
+    return graph.compile(checkpointer=InMemorySaver())
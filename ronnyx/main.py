@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
@@ -28,7 +29,12 @@ async def lifespan(app: FastAPI):
 
     app.state.graph = build_graph(tools, config)
     app.state.tool_names = [t.name for t in tools]
-    app.state.sessions = {}
+
+    if any(t.name.startswith("github_") for t in tools):
+        from ronnyx.tools import github
+
+        asyncio.get_running_loop().run_in_executor(None, github.warm_up)
+
     yield
 
 
@@ -36,7 +42,9 @@ app = FastAPI(title="Ronnyx", lifespan=lifespan)
 
 app.include_router(chat_router, prefix="/api")
 
+_ROOT_PAYLOAD = {"name": "ronnyx", "status": "ok"}
+
 
 @app.get("/")
-def root():
-    return {"name": "ronnyx", "status": "ok"}
+async def root():
+    return _ROOT_PAYLOAD
@@ -1,8 +1,30 @@
+import logging
+import os
+
 import uvicorn
 
+logger = logging.getLogger("ronnyx")
+
 
 def main():
-    uvicorn.run("ronnyx.main:app", host="0.0.0.0", port=8000, reload=False)
+    workers = int(os.getenv("RONNYX_WORKERS", "1"))
+    if workers > 1:
+        # Conversation history lives in a per-process InMemorySaver, so with
+        # multiple workers a session's turns land on different processes and
+        # history fragments. Run one worker until a shared checkpointer
+        # (e.g. Postgres/Redis) is wired up.
+        logger.warning(
+            "RONNYX_WORKERS=%d: conversation state is per-process; sessions "
+            "will lose history across workers. Use 1 worker for stateful chat.",
+            workers,
+        )
+    uvicorn.run(
+        "ronnyx.main:app",
+        host=os.getenv("RONNYX_HOST", "0.0.0.0"),
+        port=int(os.getenv("RONNYX_PORT", "8000")),
+        workers=workers,
+        reload=False,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,897 @@
+"""Bundled GitHub tools backed by the REST API.
+
+Ready-made custom tools for agents that talk to GitHub without running a
+separate MCP server. Reference them from ronnyx.yaml like any other custom
+tool:
+
+    custom_tools:
+      - function: ronnyx.tools.github.github_list_repos
+      - function: ronnyx.tools.github.github_create_issue
+
+Authentication uses the GITHUB_TOKEN environment variable (a classic or
+fine-grained PAT). GITHUB_DEFAULT_OWNER, when set, lets tools accept a bare
+repo name instead of "owner/repo".
+
+All HTTP traffic goes through one module-level requests.Session so every
+call reuses the pooled TLS connection to api.github.com instead of paying a
+fresh handshake per tool invocation.
+"""
+
+import base64
+import functools
+import itertools
+import logging
+import os
+import re
+import threading
+import time
+from typing import Literal, Optional
+
+import httpx
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger("ronnyx")
+
+_API_ROOT = "https://api.github.com"
+
+
+@functools.lru_cache(maxsize=1)
+def _tokens() -> tuple:
+    """Configured tokens: GITHUB_TOKENS (comma-separated) or GITHUB_TOKEN."""
+    raw = os.getenv("GITHUB_TOKENS", "") or os.getenv("GITHUB_TOKEN", "")
+    return tuple(t.strip() for t in raw.split(",") if t.strip())
+
+
+def _build_headers(token: str = "") -> dict:
+    headers = {
+        "Accept": "application/vnd.github+json",
+        # Explicit rather than relying on client defaults: GitHub gzips JSON
+        # bodies roughly 10x, which matters most on large list responses.
+        "Accept-Encoding": "gzip, deflate",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
+
+
+@functools.lru_cache(maxsize=8)
+def _gh_session(token: str = "") -> requests.Session:
+    """One pooled session per token; built on first use."""
+    session = requests.Session()
+    session.headers.update(_build_headers(token))
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=64)
+    session.mount("https://", adapter)
+    return session
+
+
+_token_lock = threading.Lock()
+_token_cycle = None
+
+
+def _next_session() -> requests.Session:
+    """Round-robin over the configured tokens to spread rate-limit spend."""
+    global _token_cycle
+    with _token_lock:
+        if _token_cycle is None:
+            _token_cycle = itertools.cycle(_tokens() or ("",))
+        token = next(_token_cycle)
+    return _gh_session(token)
+
+
+@functools.lru_cache(maxsize=1)
+def _async_client() -> httpx.AsyncClient:
+    """Shared async client for the _async tool variants.
+
+    HTTP/2 multiplexes concurrent calls over one connection to
+    api.github.com instead of opening a socket per request.
+    """
+    tokens = _tokens()
+    return httpx.AsyncClient(
+        base_url=_API_ROOT,
+        headers=_build_headers(tokens[0] if tokens else ""),
+        timeout=30,
+        http2=True,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=64),
+    )
+
+
+def _error_from(response) -> dict:
+    reason = getattr(response, "reason", "") or getattr(response, "reason_phrase", "")
+    try:
+        detail = response.json().get("message", reason)
+    except ValueError:
+        detail = reason
+    return _err(f"GitHub API {response.status_code}: {detail}")
+
+
+async def _acall(method: str, path: str, **kwargs):
+    """Async twin of _call, on the shared httpx client."""
+    try:
+        response = await _async_client().request(method, path, **kwargs)
+    except httpx.HTTPError as e:
+        return None, _err(f"GitHub request failed: {e}")
+    if response.status_code >= 400:
+        return None, _error_from(response)
+    if response.status_code == 204 or not response.content:
+        return {}, None
+    return orjson.loads(response.content), None
+
+
+# Last-seen primary rate-limit state, updated from every response. When the
+# quota is exhausted we stall instead of hammering the API into 403s; a
+# Retry-After on 403/429 is honored once per call.
+_rate_state = {"remaining": None, "reset": 0.0}
+_RATE_MAX_SLEEP = 60.0
+
+
+def _throttle() -> None:
+    if _rate_state["remaining"] == 0:
+        delay = _rate_state["reset"] - time.time()
+        if delay > 0:
+            time.sleep(min(delay, _RATE_MAX_SLEEP))
+
+
+def _record_rate_limit(response) -> None:
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    reset = response.headers.get("X-RateLimit-Reset")
+    try:
+        if remaining is not None:
+            _rate_state["remaining"] = int(remaining)
+        if reset is not None:
+            _rate_state["reset"] = float(reset)
+    except (TypeError, ValueError):
+        pass
+
+
+def _send(method: str, path: str, **kwargs):
+    """Rate-limit-aware request on the next pooled session."""
+    _throttle()
+    session = _next_session()
+    response = session.request(method, _API_ROOT + path, timeout=30, **kwargs)
+    _record_rate_limit(response)
+    if response.status_code in (403, 429):
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                delay = min(float(retry_after), _RATE_MAX_SLEEP)
+            except (TypeError, ValueError):
+                delay = 1.0
+            logger.warning("GitHub rate limited; retrying in %.1fs", delay)
+            time.sleep(delay)
+            response = session.request(method, _API_ROOT + path, timeout=30, **kwargs)
+            _record_rate_limit(response)
+    return response
+
+
+def _call(method: str, path: str, **kwargs):
+    """Issue one API call. Returns (json_payload, None) or (None, error dict)."""
+    try:
+        response = _send(method, path, **kwargs)
+    except requests.RequestException as e:
+        return None, _err(f"GitHub request failed: {e}")
+    if response.status_code >= 400:
+        return None, _error_from(response)
+    if response.status_code == 204 or not response.content:
+        return {}, None
+    return orjson.loads(response.content), None
+
+
+def warm_up() -> None:
+    """Prime DNS and the TLS connection pool with one cheap request.
+
+    Called in the background at server startup so the first real tool call
+    skips the DNS + TCP + TLS handshake (typically a few hundred ms).
+    /rate_limit does not count against the quota. Failures are swallowed:
+    warm-up is an optimization, never a startup error.
+    """
+    try:
+        _send("GET", "/rate_limit")
+    except requests.RequestException:
+        pass
+
+
+# Parallel tool calls from one model turn often hit the same endpoint with
+# the same arguments. Single-flight lets the first thread do the request and
+# hands its result to everyone who piled up behind it.
+_inflight: dict = {}
+_inflight_lock = threading.Lock()
+
+
+def _single_flight(key, fetch):
+    """Run fetch once per key at a time; concurrent callers share the result."""
+    with _inflight_lock:
+        pending = _inflight.get(key)
+        if pending is None:
+            pending = threading.Event()
+            _inflight[key] = pending
+            leader = True
+        else:
+            leader = False
+    if not leader:
+        pending.wait()
+        if pending.exc is not None:
+            raise pending.exc
+        return pending.result
+    pending.result, pending.exc = None, None
+    try:
+        pending.result = fetch()
+    except BaseException as e:
+        pending.exc = e
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+        pending.set()
+    return pending.result
+
+
+# GitHub returns strong ETags on list endpoints, and 304 replies don't count
+# against the primary rate limit — revalidating is nearly free when nothing
+# changed.
+_etag_cache: dict = {}
+
+
+def _cached_get(path: str, params: Optional[dict] = None):
+    """GET with If-None-Match revalidation. Returns (json_payload, error)."""
+    key = (path, tuple(sorted((params or {}).items())))
+    return _single_flight(key, lambda: _revalidated_get(key, path, params))
+
+
+def _revalidated_get(key, path: str, params: Optional[dict]):
+    cached = _etag_cache.get(key)
+    headers = {"If-None-Match": cached[0]} if cached else None
+    try:
+        response = _send("GET", path, params=params, headers=headers)
+    except requests.RequestException as e:
+        return None, _err(f"GitHub request failed: {e}")
+    if response.status_code == 304 and cached:
+        return cached[1], None
+    if response.status_code >= 400:
+        return None, _error_from(response)
+    data = orjson.loads(response.content)
+    etag = response.headers.get("ETag")
+    if etag:
+        _etag_cache[key] = (etag, data)
+    return data, None
+
+
+def _ok(payload: dict) -> dict:
+    # Callers always pass a fresh dict, so tag it in place instead of copying.
+    payload["success"] = True
+    return payload
+
+
+def _err(message: str) -> dict:
+    return {"success": False, "error": message}
+
+
+@functools.lru_cache(maxsize=1)
+def _default_owner() -> str:
+    return os.getenv("GITHUB_DEFAULT_OWNER", "")
+
+
+@functools.lru_cache(maxsize=256)
+def _qualified(owner: str, repo: str) -> Optional[str]:
+    owner = owner or _default_owner()
+    if not owner:
+        return None
+    return f"{owner}/{repo}"
+
+
+def _full_name(owner: str, repo: str) -> Optional[str]:
+    """Resolve "owner/repo"; falls back to GITHUB_DEFAULT_OWNER for bare names."""
+    if "/" in repo:
+        return repo
+    return _qualified(owner, repo)
+
+
+# GitHub's owner/repo alphabet. Tool arguments are model-supplied, so names
+# are checked against this before being embedded anywhere sensitive.
+_GH_NAME_RE = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+_MISSING_OWNER = (
+    "No owner given and GITHUB_DEFAULT_OWNER is not set; "
+    "pass owner or use 'owner/repo'."
+)
+
+
+def github_whoami() -> dict:
+    """Get the login, name and plan of the authenticated GitHub user."""
+    data, error = _call("GET", "/user")
+    if error:
+        return error
+    return _ok({"login": data.get("login"), "name": data.get("name")})
+
+
+def github_rate_limit() -> dict:
+    """Get the remaining GitHub API rate limit for the current token."""
+    data, error = _call("GET", "/rate_limit")
+    if error:
+        return error
+    core = data.get("resources", {}).get("core", {})
+    return _ok(
+        {
+            "limit": core.get("limit"),
+            "remaining": core.get("remaining"),
+            "reset": core.get("reset"),
+        }
+    )
+
+
+# Models occasionally invent argument values despite the Literal schema hints,
+# and an invalid value otherwise burns an API call on a guaranteed 422. These
+# precompiled sets reject bad input before any request is made.
+_VISIBILITIES = frozenset(("all", "public", "private"))
+_STATES = frozenset(("open", "closed", "all"))
+
+
+def github_list_repos(
+    visibility: Literal["all", "public", "private"] = "all", limit: int = 30
+) -> dict:
+    """List repositories of the authenticated user, most recently pushed first."""
+    if visibility not in _VISIBILITIES:
+        return _err(f"visibility must be one of {sorted(_VISIBILITIES)}.")
+    cap = max(1, min(limit, 100))
+    data, error = _cached_get(
+        "/user/repos",
+        params={"visibility": visibility, "sort": "pushed", "per_page": cap},
+    )
+    if error:
+        return error
+    repos = [
+        {
+            "full_name": r["full_name"],
+            "private": r["private"],
+            "description": r.get("description"),
+            "pushed_at": r.get("pushed_at"),
+        }
+        for r in data[:cap]
+    ]
+    return _ok({"repos": repos})
+
+
+# Repo metadata changes rarely; a short TTL absorbs the repeated lookups an
+# agent makes while working on one repository without serving stale data for
+# long.
+_REPO_CACHE_TTL = 60.0
+_repo_cache: dict = {}
+
+
+def _get_repo(full: str):
+    """Fetch repo metadata with a short TTL cache. Returns (payload, error)."""
+    cached = _repo_cache.get(full)
+    if cached is not None and time.monotonic() - cached[0] < _REPO_CACHE_TTL:
+        return cached[1], None
+    data, error = _call("GET", f"/repos/{full}")
+    if error:
+        return None, error
+    payload = {
+        "full_name": data["full_name"],
+        "description": data.get("description"),
+        "default_branch": data.get("default_branch"),
+        "private": data.get("private"),
+        "stars": data.get("stargazers_count"),
+        "open_issues": data.get("open_issues_count"),
+    }
+    _repo_cache[full] = (time.monotonic(), payload)
+    return payload, None
+
+
+def github_get_repo(repo: str, owner: str = "") -> dict:
+    """Get metadata (description, default branch, stars) for one repository."""
+    full = _full_name(owner, repo)
+    if full is None:
+        return _err(_MISSING_OWNER)
+    payload, error = _get_repo(full)
+    if error:
+        return error
+    return _ok(dict(payload))
+
+
+def github_list_branches(repo: str, owner: str = "", limit: int = 30) -> dict:
+    """List branch names of a repository."""
+    full = _full_name(owner, repo)
+    if full is None:
+        return _err(_MISSING_OWNER)
+    cap = max(1, min(limit, 100))
+    data, error = _cached_get(f"/repos/{full}/branches", params={"per_page": cap})
+    if error:
+        return error
+    branches = [{"name": b["name"]} for b in data[:cap]]
+    return _ok({"repo": full, "branches": branches})
+
+
+def _issue_row(i: dict) -> dict:
+    return {
+        "number": i["number"],
+        "title": i["title"],
+        "state": i["state"],
+        "user": i.get("user", {}).get("login"),
+        "created_at": i.get("created_at"),
+    }
+
+
+def _pr_row(p: dict) -> dict:
+    return {
+        "number": p["number"],
+        "title": p["title"],
+        "state": p["state"],
+        "user": p.get("user", {}).get("login"),
+        "head": p.get("head", {}).get("ref"),
+        "base": p.get("base", {}).get("ref"),
+    }
+
+
+def _commit_row(c: dict) -> dict:
+    commit = c.get("commit", {})
+    author = commit.get("author", {})
+    message = commit.get("message") or ""
+    return {
+        "sha": c["sha"],
+        "message": message.split("\n", 1)[0],
+        "author": author.get("name"),
+        "date": author.get("date"),
+    }
+
+
+def github_list_issues(
+    repo: str,
+    owner: str = "",
+    state: Literal["open", "closed", "all"] = "open",
+    limit: int = 30,
+) -> dict:
+    """List issues of a repository (excludes pull requests)."""
+    full = _full_name(owner, repo)
+    if full is None:
+        return _err(_MISSING_OWNER)
+    if state not in _STATES:
+        return _err(f"state must be one of {sorted(_STATES)}.")
+    cap = max(1, min(limit, 100))
+    data, error = _cached_get(
+        f"/repos/{full}/issues", params={"state": state, "per_page": cap}
+    )
+    if error:
+        return error
+    issues = [_issue_row(i) for i in data if "pull_request" not in i][:cap]
+    return _ok({"repo": full, "issues": issues})
+
+
+async def github_list_issues_async(
+    repo: str,
+    owner: str = "",
+    state: Literal["open", "closed", "all"] = "open",
+    limit: int = 30,
+) -> dict:
+    """List issues of a repository (excludes pull requests). Async variant."""
+    full = _full_name(owner, repo)
+    if full is None:
+        return _err(_MISSING_OWNER)
+    if state not in _STATES:
+        return _err(f"state must be one of {sorted(_STATES)}.")
+    cap = max(1, min(limit, 100))
+    data, error = await _acall(
+        "GET", f"/repos/{full}/issues", params={"state": state, "per_page": cap}
+    )
+    if error:
+        return error
+    issues = [_issue_row(i) for i in data if "pull_request" not in i][:cap]
+    return _ok({"repo": full, "issues": issues})
+
+
+def github_list_prs(
+    repo: str,
+    owner: str = "",
+    state: Literal["open", "closed", "all"] = "open",
+    limit: int = 30,
+) -> dict:
+    """List pull requests of a repository."""
+    full = _full_name(owner, repo)
+    if full is None:
+        return _err(_MISSING_OWNER)
+    if state not in _STATES:
+        return _err(f"state must be one of {sorted(_STATES)}.")
+    cap = max(1, min(limit, 100))
+    data, error = _cached_get(
+        f"/repos/{full}/pulls", params={"state": state, "per_page": cap}
+    )
+    if error:
+        return error
+    prs = [_pr_row(p) for p in data[:cap]]
+    return _ok({"repo": full, "prs": prs})
+
+
+async def github_list_prs_async(
+    repo: str,
+    owner: str = "",
+    state: Literal["open", "closed", "all"] = "open",
+    limit: int = 30,
+) -> dict:
+    """List pull requests of a repository. Async variant."""
+    full = _full_name(owner, repo)
+    if full is None:
+        return _err(_MISSING_OWNER)
+    if state not in _STATES:
+        return _err(f"state must be one of {sorted(_STATES)}.")
+    cap = max(1, min(limit, 100))
+    data, error = await _acall(
+        "GET", f"/repos/{full}/pulls", params={"state": state, "per_page": cap}
+    )
+    if error:
+        return error
+    return _ok({"repo": full, "prs": [_pr_row(p) for p in data[:cap]]})
+
+
+def github_list_commits(
+    repo: str, owner: str = "", branch: str = "", limit: int = 30
+) -> dict:
+    """List recent commits on a branch (default branch when unset)."""
+    full = _full_name(owner, repo)
+    if full is None:
+        return _err(_MISSING_OWNER)
+    cap = max(1, min(limit, 100))
+    params = {"sha": branch, "per_page": cap} if branch else {"per_page": cap}
+    data, error = _cached_get(f"/repos/{full}/commits", params=params)
+    if error:
+        return error
+    commits = [_commit_row(c) for c in data[:cap]]
+    return _ok({"repo": full, "commits": commits})
+
+
+# Search shares GitHub's tight 30 req/min secondary limit, and agents tend to
+# re-run identical queries while refining an answer. A short TTL absorbs the
+# repeats without returning stale results for long.
+_SEARCH_CACHE_TTL = 60.0
+_SEARCH_CACHE_MAX = 128
+_search_cache: dict = {}
+
+
+def _search_cache_get(key):
+    entry = _search_cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < _SEARCH_CACHE_TTL:
+        return dict(entry[1])
+    return None
+
+
+def _search_cache_put(key, result: dict) -> None:
+    if len(_search_cache) >= _SEARCH_CACHE_MAX:
+        _search_cache.pop(next(iter(_search_cache)))
+    _search_cache[key] = (time.monotonic(), result)
+
+
+def github_search_repositories(query: str, limit: int = 10) -> dict:
+    """Search public repositories by keyword query."""
+    cap = max(1, min(limit, 100))
+    cache_key = ("repositories", query, cap)
+    cached = _search_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    data, error = _call(
+        "GET", "/search/repositories", params={"q": query, "per_page": cap}
+    )
+    if error:
+        return error
+    repos = [
+        {
+            "full_name": r["full_name"],
+            "description": r.get("description"),
+            "stars": r.get("stargazers_count"),
+        }
+        for r in data.get("items", [])[:cap]
+    ]
+    result = _ok({"total": data.get("total_count"), "repos": repos})
+    _search_cache_put(cache_key, result)
+    return result
+
+
+def github_search_issues(query: str, limit: int = 10) -> dict:
+    """Search issues and pull requests by keyword query."""
+    cap = max(1, min(limit, 100))
+    cache_key = ("issues", query, cap)
+    cached = _search_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    data, error = _call("GET", "/search/issues", params={"q": query, "per_page": cap})
+    if error:
+        return error
+    issues = [
+        {
+            "title": i["title"],
+            "state": i["state"],
+            "url": i.get("html_url"),
+        }
+        for i in data.get("items", [])[:cap]
+    ]
+    result = _ok({"total": data.get("total_count"), "issues": issues})
+    _search_cache_put(cache_key, result)
+    return result
+
+
+# Blob shas seen on any read or write, so repeated edits to the same file
+# skip the lookup round-trip. A stale entry surfaces as a 409 conflict and is
+# retried once with a fresh sha.
+_file_sha_cache: dict = {}
+
+
+def _file_sha(full: str, path: str, branch: str):
+    """Current blob sha for a file, cached. Returns (sha, error)."""
+    key = (full, branch, path)
+    sha = _file_sha_cache.get(key)
+    if sha:
+        return sha, None
+    params = {"ref": branch} if branch else {}
+    current, error = _call("GET", f"/repos/{full}/contents/{path}", params=params)
+    if error:
+        return None, error
+    sha = current.get("sha")
+    _file_sha_cache[key] = sha
+    return sha, None
+
+
+def _remember_sha(full: str, path: str, branch: str, data: dict) -> None:
+    sha = data.get("content", {}).get("sha") if data else None
+    if sha:
+        _file_sha_cache[(full, branch, path)] = sha
+
+
+def github_get_file(repo: str, path: str, owner: str = "", branch: str = "") -> dict:
+    """Read a file's text content from a repository."""
+    full = _full_name(owner, repo)
+    if full is None:
+        return _err(_MISSING_OWNER)
+    params = {"ref": branch} if branch else {}
+    data, error = _call("GET", f"/repos/{full}/contents/{path}", params=params)
+    if error:
+        return error
+    if data.get("type") != "file":
+        return _err(f"'{path}' is not a file.")
+    _file_sha_cache[(full, branch, path)] = data.get("sha")
+    content = base64.b64decode(data.get("content", "")).decode("utf-8", "replace")
+    return _ok({"repo": full, "path": path, "sha": data.get("sha"), "content": content})
+
+
+def github_create_file(
+    repo: str,
+    path: str,
+    content: str,
+    message: str,
+    owner: str = "",
+    branch: str = "",
+) -> dict:
+    """Create a new file in a repository with a commit message."""
+    full = _full_name(owner, repo)
+    if full is None:
+        return _err(_MISSING_OWNER)
+    body = {
+        "message": message,
+        "content": base64.b64encode(content.encode()).decode(),
+    }
+    if branch:
+        body["branch"] = branch
+    data, error = _call("PUT", f"/repos/{full}/contents/{path}", json=body)
+    if error:
+        return error
+    _remember_sha(full, path, branch, data)
+    return _ok(
+        {
+            "repo": full,
+            "path": path,
+            "commit": data.get("commit", {}).get("sha"),
+        }
+    )
+
+
+def github_create_files(
+    repo: str,
+    files: list,
+    message: str,
+    owner: str = "",
+    branch: str = "",
+) -> dict:
+    """Commit several files at once as a single atomic commit.
+
+    files is a list of {"path": ..., "content": ...} dicts. Uses the Git Data
+    API (ref -> tree -> commit -> ref update), so N files cost four requests
+    and one commit instead of 2N requests and N commits.
+    """
+    full = _full_name(owner, repo)
+    if full is None:
+        return _err(_MISSING_OWNER)
+    if not files:
+        return _err("files must not be empty.")
+    if not all(isinstance(f, dict) and "path" in f and "content" in f for f in files):
+        return _err("each file needs 'path' and 'content' keys.")
+    if not branch:
+        meta, error = _get_repo(full)
+        if error:
+            return error
+        branch = meta.get("default_branch") or "main"
+
+    ref, error = _call("GET", f"/repos/{full}/git/ref/heads/{branch}")
+    if error:
+        return error
+    parent_sha = ref.get("object", {}).get("sha")
+
+    parent, error = _call("GET", f"/repos/{full}/git/commits/{parent_sha}")
+    if error:
+        return error
+
+    tree_entries = [
+        {"path": f["path"], "mode": "100644", "type": "blob", "content": f["content"]}
+        for f in files
+    ]
+    tree, error = _call(
+        "POST",
+        f"/repos/{full}/git/trees",
+        json={"base_tree": parent.get("tree", {}).get("sha"), "tree": tree_entries},
+    )
+    if error:
+        return error
+
+    commit, error = _call(
+        "POST",
+        f"/repos/{full}/git/commits",
+        json={"message": message, "tree": tree.get("sha"), "parents": [parent_sha]},
+    )
+    if error:
+        return error
+
+    _, error = _call(
+        "PATCH",
+        f"/repos/{full}/git/refs/heads/{branch}",
+        json={"sha": commit.get("sha")},
+    )
+    if error:
+        return error
+    return _ok(
+        {
+            "repo": full,
+            "branch": branch,
+            "commit": commit.get("sha"),
+            "files": [f["path"] for f in files],
+        }
+    )
+
+
+def github_update_file(
+    repo: str,
+    path: str,
+    content: str,
+    message: str,
+    owner: str = "",
+    branch: str = "",
+) -> dict:
+    """Replace a file's content in a repository with a commit message."""
+    full = _full_name(owner, repo)
+    if full is None:
+        return _err(_MISSING_OWNER)
+    sha, error = _file_sha(full, path, branch)
+    if error:
+        return error
+    body = {
+        "message": message,
+        "content": base64.b64encode(content.encode()).decode(),
+        "sha": sha,
+    }
+    if branch:
+        body["branch"] = branch
+    data, error = _call("PUT", f"/repos/{full}/contents/{path}", json=body)
+    if error and error["error"].startswith("GitHub API 409"):
+        # Cached sha was stale; refresh and retry once.
+        _file_sha_cache.pop((full, branch, path), None)
+        sha, error = _file_sha(full, path, branch)
+        if error:
+            return error
+        body["sha"] = sha
+        data, error = _call("PUT", f"/repos/{full}/contents/{path}", json=body)
+    if error:
+        return error
+    _remember_sha(full, path, branch, data)
+    return _ok(
+        {
+            "repo": full,
+            "path": path,
+            "commit": data.get("commit", {}).get("sha"),
+        }
+    )
+
+
+def github_delete_file(
+    repo: str, path: str, message: str, owner: str = "", branch: str = ""
+) -> dict:
+    """Delete a file from a repository with a commit message."""
+    full = _full_name(owner, repo)
+    if full is None:
+        return _err(_MISSING_OWNER)
+    sha, error = _file_sha(full, path, branch)
+    if error:
+        return error
+    body = {"message": message, "sha": sha}
+    if branch:
+        body["branch"] = branch
+    data, error = _call("DELETE", f"/repos/{full}/contents/{path}", json=body)
+    if error and error["error"].startswith("GitHub API 409"):
+        _file_sha_cache.pop((full, branch, path), None)
+        sha, error = _file_sha(full, path, branch)
+        if error:
+            return error
+        body["sha"] = sha
+        data, error = _call("DELETE", f"/repos/{full}/contents/{path}", json=body)
+    if error:
+        return error
+    _file_sha_cache.pop((full, branch, path), None)
+    return _ok(
+        {
+            "repo": full,
+            "path": path,
+            "commit": data.get("commit", {}).get("sha"),
+        }
+    )
+
+
+def github_get_issues_batch(repo: str, numbers: list, owner: str = "") -> dict:
+    """Get state, title and url for several issues in one request."""
+    full = _full_name(owner, repo)
+    if full is None:
+        return _err(_MISSING_OWNER)
+    if not numbers:
+        return _err("numbers must not be empty.")
+    try:
+        numbers = [int(n) for n in numbers]
+    except (TypeError, ValueError):
+        return _err("numbers must be integers.")
+    owner_part, name = full.split("/", 1)
+    if not (_GH_NAME_RE.match(owner_part) and _GH_NAME_RE.match(name)):
+        return _err(f"'{full}' is not a valid owner/repo name.")
+    # One aliased GraphQL query resolves all issues for a single rate-limit
+    # point instead of N REST calls. Aliases are built from the int-coerced
+    # numbers; owner and name travel as variables, never in the query text.
+    fields = " ".join(
+        f"i{n}: issue(number: {n}) {{ number state title url }}" for n in numbers
+    )
+    query = (
+        "query($owner: String!, $name: String!) "
+        f"{{ repository(owner: $owner, name: $name) {{ {fields} }} }}"
+    )
+    data, error = _call(
+        "POST",
+        "/graphql",
+        json={"query": query, "variables": {"owner": owner_part, "name": name}},
+    )
+    if error:
+        return error
+    if data.get("errors"):
+        return _err(f"GitHub GraphQL: {data['errors'][0].get('message', 'error')}")
+    repository = data.get("data", {}).get("repository") or {}
+    issues = [issue for issue in repository.values() if issue]
+    return _ok({"repo": full, "issues": issues})
+
+
+def github_create_issue(repo: str, title: str, body: str = "", owner: str = "") -> dict:
+    """Open a new issue in a repository."""
+    full = _full_name(owner, repo)
+    if full is None:
+        return _err(_MISSING_OWNER)
+    data, error = _call(
+        "POST", f"/repos/{full}/issues", json={"title": title, "body": body}
+    )
+    if error:
+        return error
+    return _ok(
+        {"repo": full, "number": data.get("number"), "url": data.get("html_url")}
+    )
+
+
+def github_close_issue(repo: str, number: int, owner: str = "") -> dict:
+    """Close an issue by number."""
+    full = _full_name(owner, repo)
+    if full is None:
+        return _err(_MISSING_OWNER)
+    data, error = _call(
+        "PATCH", f"/repos/{full}/issues/{number}", json={"state": "closed"}
+    )
+    if error:
+        return error
+    return _ok({"repo": full, "number": number, "state": data.get("state")})
@@ -0,0 +1,95 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from ronnyx.core.agent import _run_tool_call, build_graph
+
+
+def _config(**overrides):
+    config = MagicMock()
+    config.llm_model = "test-model"
+    config.llm_api_key = "test-key"
+    config.llm_max_history_tokens = 0
+    config.llm_cache_replies = False
+    config.build_context.return_value = ""
+    for name, value in overrides.items():
+        setattr(config, name, value)
+    return config
+
+
+class TestHistoryTrimming:
+    def test_overlong_turn_is_still_sent(self):
+        seen = []
+        llm = MagicMock()
+
+        async def ainvoke(msgs):
+            seen.append(msgs)
+            return AIMessage(content="ok")
+
+        llm.ainvoke = ainvoke
+        with patch("ronnyx.core.agent._make_llm", return_value=llm):
+            graph = build_graph([], _config(llm_max_history_tokens=10))
+            asyncio.run(
+                graph.ainvoke(
+                    {"messages": [HumanMessage(content="word " * 500)]},
+                    config={"configurable": {"thread_id": "t1"}},
+                )
+            )
+
+        sent = seen[0]
+        assert sent[-1].type == "human"
+        assert "word" in sent[-1].content
+
+
+class TestRunToolCall:
+    def test_invokes_matching_tool(self):
+        tool = MagicMock()
+        tool.ainvoke = AsyncMock(return_value="result")
+        tc = {"name": "my_tool", "args": {"x": 1}, "id": "call-1"}
+
+        msg = asyncio.run(_run_tool_call({"my_tool": tool}, tc))
+
+        tool.ainvoke.assert_awaited_once_with({"x": 1})
+        assert msg.content == "result"
+        assert msg.tool_call_id == "call-1"
+
+    def test_unknown_tool_returns_message(self):
+        tc = {"name": "missing", "args": {}, "id": "call-2"}
+        msg = asyncio.run(_run_tool_call({}, tc))
+        assert "not found" in msg.content
+        assert msg.tool_call_id == "call-2"
+
+    def test_tool_error_is_captured(self):
+        tool = MagicMock()
+        tool.ainvoke = AsyncMock(side_effect=RuntimeError("boom"))
+        tc = {"name": "bad", "args": {}, "id": "call-3"}
+
+        msg = asyncio.run(_run_tool_call({"bad": tool}, tc))
+
+        assert "Tool error" in msg.content
+        assert "boom" in msg.content
+
+    def test_parallel_calls_overlap(self):
+        started = []
+
+        async def slow(args):
+            started.append(args["n"])
+            await asyncio.sleep(0.01)
+            return args["n"]
+
+        tool = MagicMock()
+        tool.ainvoke = slow
+        tool_map = {"slow": tool}
+        calls = [
+            {"name": "slow", "args": {"n": i}, "id": f"call-{i}"} for i in range(3)
+        ]
+
+        async def run():
+            return await asyncio.gather(
+                *(_run_tool_call(tool_map, tc) for tc in calls)
+            )
+
+        results = asyncio.run(run())
+        assert [m.content for m in results] == ["0", "1", "2"]
+        assert sorted(started) == [0, 1, 2]
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 from fastapi.testclient import TestClient
 from langchain_core.messages import AIMessage, HumanMessage
@@ -10,7 +10,6 @@ from ronnyx.main import app
 @pytest.fixture
 def client():
     app.state.tool_names = ["search_repositories", "list_issues"]
-    app.state.sessions = {}
     app.state.graph = AsyncMock()
     return TestClient(app, raise_server_exceptions=True)
 
@@ -55,7 +54,7 @@ class TestChatEndpoint:
         resp = client.post("/api/chat", json={"session_id": "1", "message": "test"})
         assert resp.json()["reply"] == "actual reply"
 
-    def test_maintains_session(self, client):
+    def test_session_id_becomes_thread_id(self, client):
         app.state.graph.ainvoke = AsyncMock(return_value={
             "messages": [
                 HumanMessage(content="msg1"),
@@ -63,8 +62,29 @@ class TestChatEndpoint:
             ]
         })
         client.post("/api/chat", json={"session_id": "s1", "message": "msg1"})
-        assert "s1" in app.state.sessions
+        _, kwargs = app.state.graph.ainvoke.call_args
+        assert kwargs["config"]["configurable"]["thread_id"] == "s1"
 
     def test_missing_fields_returns_422(self, client):
         resp = client.post("/api/chat", json={"message": "no session"})
         assert resp.status_code == 422
+
+
+class TestChatStreamEndpoint:
+    def test_streams_model_chunks(self, client):
+        async def events(*args, **kwargs):
+            for text in ["hel", "lo"]:
+                chunk = MagicMock()
+                chunk.content = text
+                yield {"event": "on_chat_model_stream", "data": {"chunk": chunk}}
+            yield {"event": "on_chain_end", "data": {}}
+
+        app.state.graph.astream_events = MagicMock(side_effect=events)
+        resp = client.post(
+            "/api/chat/stream", json={"session_id": "1", "message": "hello"}
+        )
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        assert 'data: {"delta": "hel"}' in resp.text
+        assert 'data: {"delta": "lo"}' in resp.text
+        assert resp.text.rstrip().endswith("data: [DONE]")
@@ -58,6 +58,30 @@ class TestRonnyxConfig:
         assert config.llm_model == "gpt-4o-mini"
         assert config.llm_api_key == "test-key"
 
+    def test_max_history_tokens_defaults_to_zero(self, tmp_path):
+        cfg = tmp_path / "ronnyx.yaml"
+        cfg.write_text("llm:\n  api_key: test-key\n")
+        config = RonnyxConfig(path=str(cfg))
+        assert config.llm_max_history_tokens == 0
+
+    def test_loads_max_history_tokens(self, tmp_path):
+        cfg = tmp_path / "ronnyx.yaml"
+        cfg.write_text("llm:\n  api_key: test-key\n  max_history_tokens: 4000\n")
+        config = RonnyxConfig(path=str(cfg))
+        assert config.llm_max_history_tokens == 4000
+
+    def test_cache_replies_defaults_to_false(self, tmp_path):
+        cfg = tmp_path / "ronnyx.yaml"
+        cfg.write_text("llm:\n  api_key: test-key\n")
+        config = RonnyxConfig(path=str(cfg))
+        assert config.llm_cache_replies is False
+
+    def test_loads_cache_replies(self, tmp_path):
+        cfg = tmp_path / "ronnyx.yaml"
+        cfg.write_text("llm:\n  api_key: test-key\n  cache_replies: true\n")
+        config = RonnyxConfig(path=str(cfg))
+        assert config.llm_cache_replies is True
+
     def test_defaults_to_gpt4o(self, tmp_path):
         cfg = tmp_path / "ronnyx.yaml"
         cfg.write_text("llm:\n  api_key: test-key\n")
@@ -161,6 +185,31 @@ class TestCustomTools:
         finally:
             sys.path.remove(str(tmp_path))
 
+    def test_loads_async_callable(self, tmp_path):
+        tool_file = tmp_path / "my_async_tool.py"
+        tool_file.write_text(
+            "async def fetch(url: str) -> str:\n    return url\n"
+        )
+
+        cfg = tmp_path / "ronnyx.yaml"
+        cfg.write_text(
+            "llm:\n  api_key: k\n"
+            "custom_tools:\n"
+            "  - function: my_async_tool.fetch\n"
+            "    name: fetch\n"
+            "    description: fetch a url\n"
+        )
+
+        import sys
+        sys.path.insert(0, str(tmp_path))
+        try:
+            config = RonnyxConfig(path=str(cfg))
+            tools = config.load_custom_tools()
+            assert len(tools) == 1
+            assert tools[0].coroutine is not None
+        finally:
+            sys.path.remove(str(tmp_path))
+
     def test_invalid_function_path_skipped(self, tmp_path):
         cfg = tmp_path / "ronnyx.yaml"
         cfg.write_text(
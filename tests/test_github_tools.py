@@ -0,0 +1,485 @@
+import json
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+from ronnyx.tools import github
+
+
+def _response(status=200, payload=None, content=None, headers=None):
+    resp = MagicMock()
+    resp.status_code = status
+    body = payload if payload is not None else {}
+    resp.content = content if content is not None else json.dumps(body).encode()
+    resp.json.return_value = body
+    resp.reason = "Error"
+    resp.headers = headers or {}
+    return resp
+
+
+def _patch_session(response):
+    session = MagicMock()
+    session.request.return_value = response
+    session.get.return_value = response
+    return patch("ronnyx.tools.github._gh_session", return_value=session), session
+
+
+class TestFullName:
+    def setup_method(self):
+        github._default_owner.cache_clear()
+        github._qualified.cache_clear()
+
+    def test_passthrough_with_slash(self):
+        assert github._full_name("", "alice/repo") == "alice/repo"
+
+    def test_explicit_owner(self):
+        assert github._full_name("alice", "repo") == "alice/repo"
+
+    def test_default_owner_env(self):
+        with patch.dict(os.environ, {"GITHUB_DEFAULT_OWNER": "bob"}):
+            assert github._full_name("", "repo") == "bob/repo"
+
+    def test_missing_owner_returns_none(self):
+        with patch.dict(os.environ, {}, clear=True):
+            assert github._full_name("", "repo") is None
+
+
+class TestResultHelpers:
+    def test_ok_wraps_payload(self):
+        assert github._ok({"x": 1}) == {"success": True, "x": 1}
+
+    def test_err_wraps_message(self):
+        result = github._err("nope")
+        assert result["success"] is False
+        assert result["error"] == "nope"
+
+
+class TestCall:
+    def test_http_error_becomes_err_dict(self):
+        ctx, _ = _patch_session(_response(status=404, payload={"message": "Not Found"}))
+        with ctx:
+            data, error = github._call("GET", "/missing")
+        assert data is None
+        assert "404" in error["error"]
+        assert "Not Found" in error["error"]
+
+    def test_success_returns_payload(self):
+        ctx, session = _patch_session(_response(payload={"login": "alice"}))
+        with ctx:
+            data, error = github._call("GET", "/user")
+        assert error is None
+        assert data == {"login": "alice"}
+        args, _ = session.request.call_args
+        assert args == ("GET", "https://api.github.com/user")
+
+
+class TestListRepos:
+    def test_projects_fields_and_caps_limit(self):
+        payload = [
+            {"full_name": f"a/r{i}", "private": False, "pushed_at": "t"}
+            for i in range(5)
+        ]
+        ctx, _ = _patch_session(_response(payload=payload))
+        with ctx:
+            result = github.github_list_repos(limit=2)
+        assert result["success"] is True
+        assert [r["full_name"] for r in result["repos"]] == ["a/r0", "a/r1"]
+
+    def test_error_passthrough(self):
+        ctx, _ = _patch_session(_response(status=401, payload={"message": "Bad creds"}))
+        with ctx:
+            result = github.github_list_repos()
+        assert result["success"] is False
+        assert "401" in result["error"]
+
+
+class TestWarmUp:
+    def test_pings_rate_limit(self):
+        ctx, session = _patch_session(_response(payload={}))
+        with ctx:
+            github.warm_up()
+        args, _ = session.request.call_args
+        assert args == ("GET", "https://api.github.com/rate_limit")
+
+    def test_swallows_network_errors(self):
+        import requests as requests_lib
+
+        session = MagicMock()
+        session.request.side_effect = requests_lib.ConnectionError("offline")
+        with patch("ronnyx.tools.github._gh_session", return_value=session):
+            github.warm_up()
+
+
+class TestArgumentValidation:
+    def test_bad_visibility_rejected_before_http(self):
+        ctx, session = _patch_session(_response(payload=[]))
+        with ctx:
+            result = github.github_list_repos(visibility="secret")
+        assert result["success"] is False
+        assert "visibility" in result["error"]
+        assert session.request.call_count == 0
+
+    def test_bad_state_rejected_before_http(self):
+        ctx, session = _patch_session(_response(payload=[]))
+        with ctx:
+            result = github.github_list_issues("a/r", state="merged")
+        assert result["success"] is False
+        assert "state" in result["error"]
+        assert session.request.call_count == 0
+
+
+class TestEtagCache:
+    def setup_method(self):
+        github._etag_cache.clear()
+
+    def test_304_serves_cached_payload(self):
+        session = MagicMock()
+        session.request.return_value = _response(
+            payload=[{"name": "main"}], headers={"ETag": 'W/"abc"'}
+        )
+        with patch("ronnyx.tools.github._gh_session", return_value=session):
+            first = github.github_list_branches("a/r")
+            session.request.return_value = _response(status=304)
+            second = github.github_list_branches("a/r")
+
+        assert first["branches"] == second["branches"] == [{"name": "main"}]
+        _, kwargs = session.request.call_args
+        assert kwargs["headers"] == {"If-None-Match": 'W/"abc"'}
+
+    def test_no_validator_sent_on_first_call(self):
+        session = MagicMock()
+        session.request.return_value = _response(payload=[])
+        with patch("ronnyx.tools.github._gh_session", return_value=session):
+            github.github_list_branches("a/r")
+        _, kwargs = session.request.call_args
+        assert kwargs["headers"] is None
+
+
+class TestSingleFlight:
+    def setup_method(self):
+        github._etag_cache.clear()
+
+    def test_concurrent_identical_gets_share_one_request(self):
+        import threading
+
+        release = threading.Event()
+
+        def slow_request(*args, **kwargs):
+            release.wait(timeout=2)
+            return _response(payload=[{"name": "main"}])
+
+        session = MagicMock()
+        session.request.side_effect = slow_request
+        results = []
+
+        def worker():
+            results.append(github._cached_get("/repos/a/r/branches", {"per_page": 5}))
+
+        with patch("ronnyx.tools.github._gh_session", return_value=session):
+            threads = [threading.Thread(target=worker) for _ in range(3)]
+            for t in threads:
+                t.start()
+            time.sleep(0.05)
+            release.set()
+            for t in threads:
+                t.join()
+
+        assert session.request.call_count == 1
+        assert results[0] == results[1] == results[2]
+        assert results[0][0] == [{"name": "main"}]
+
+    def test_different_keys_do_not_coalesce(self):
+        ctx, session = _patch_session(_response(payload=[]))
+        with ctx:
+            github._cached_get("/a", {"p": 1})
+            github._cached_get("/a", {"p": 2})
+        assert session.request.call_count == 2
+
+    def test_key_removed_after_flight(self):
+        ctx, _ = _patch_session(_response(payload=[]))
+        with ctx:
+            github._cached_get("/a", None)
+        assert github._inflight == {}
+
+
+class TestGetRepoCache:
+    def setup_method(self):
+        github._repo_cache.clear()
+
+    def test_second_lookup_within_ttl_skips_http(self):
+        payload = {"full_name": "a/r", "default_branch": "main"}
+        ctx, session = _patch_session(_response(payload=payload))
+        with ctx:
+            first = github.github_get_repo("a/r")
+            second = github.github_get_repo("a/r")
+        assert first["full_name"] == second["full_name"] == "a/r"
+        assert session.request.call_count == 1
+
+    def test_expired_entry_refetches(self):
+        payload = {"full_name": "a/r"}
+        ctx, session = _patch_session(_response(payload=payload))
+        with ctx:
+            github.github_get_repo("a/r")
+            ts, cached = github._repo_cache["a/r"]
+            github._repo_cache["a/r"] = (ts - github._REPO_CACHE_TTL - 1, cached)
+            github.github_get_repo("a/r")
+        assert session.request.call_count == 2
+
+
+class TestTokenRotation:
+    def test_tokens_env_splits_and_strips(self):
+        github._tokens.cache_clear()
+        with patch.dict(os.environ, {"GITHUB_TOKENS": "tok1, tok2 ,"}):
+            assert github._tokens() == ("tok1", "tok2")
+        github._tokens.cache_clear()
+
+    def test_single_token_fallback(self):
+        github._tokens.cache_clear()
+        with patch.dict(os.environ, {"GITHUB_TOKEN": "solo"}, clear=True):
+            assert github._tokens() == ("solo",)
+        github._tokens.cache_clear()
+
+    def test_round_robin_alternates_sessions(self):
+        github._tokens.cache_clear()
+        github._token_cycle = None
+        try:
+            with patch.dict(os.environ, {"GITHUB_TOKENS": "t1,t2"}):
+                github._tokens()
+                with patch(
+                    "ronnyx.tools.github._gh_session", side_effect=lambda t: t
+                ):
+                    first = github._next_session()
+                    second = github._next_session()
+                    third = github._next_session()
+            assert (first, second, third) == ("t1", "t2", "t1")
+        finally:
+            github._tokens.cache_clear()
+            github._token_cycle = None
+
+
+class TestRateLimitGuard:
+    def setup_method(self):
+        github._rate_state.update({"remaining": None, "reset": 0.0})
+
+    def test_records_headers(self):
+        resp = _response(
+            payload={},
+            headers={"X-RateLimit-Remaining": "42", "X-RateLimit-Reset": "100.0"},
+        )
+        ctx, _ = _patch_session(resp)
+        with ctx:
+            github._send("GET", "/user")
+        assert github._rate_state["remaining"] == 42
+        assert github._rate_state["reset"] == 100.0
+
+    def test_retries_once_after_retry_after(self):
+        limited = _response(status=429, headers={"Retry-After": "0"})
+        ok = _response(payload={"login": "a"})
+        session = MagicMock()
+        session.request.side_effect = [limited, ok]
+        with patch("ronnyx.tools.github._gh_session", return_value=session):
+            response = github._send("GET", "/user")
+        assert response is ok
+        assert session.request.call_count == 2
+
+    def test_exhausted_quota_stalls_until_reset(self):
+        github._rate_state.update({"remaining": 0, "reset": time.time() + 0.01})
+        ctx, _ = _patch_session(_response(payload={}))
+        with ctx:
+            start = time.monotonic()
+            github._send("GET", "/user")
+        assert time.monotonic() - start >= 0.005
+
+
+class TestAsyncVariants:
+    def test_list_issues_async_projects_rows(self):
+        import asyncio
+
+        payload = [
+            {"number": 1, "title": "t", "state": "open", "user": {"login": "a"}}
+        ]
+        resp = _response(payload=payload)
+        client = MagicMock()
+
+        async def request(*args, **kwargs):
+            return resp
+
+        client.request = request
+        with patch("ronnyx.tools.github._async_client", return_value=client):
+            result = asyncio.run(github.github_list_issues_async("a/r"))
+        assert result["success"] is True
+        assert result["issues"][0]["number"] == 1
+
+
+class TestSearchCache:
+    def setup_method(self):
+        github._search_cache.clear()
+
+    def test_repeat_query_served_from_cache(self):
+        payload = {"total_count": 1, "items": [{"full_name": "a/r"}]}
+        ctx, session = _patch_session(_response(payload=payload))
+        with ctx:
+            first = github.github_search_repositories("langgraph")
+            second = github.github_search_repositories("langgraph")
+        assert first["repos"] == second["repos"]
+        assert session.request.call_count == 1
+
+    def test_different_limit_misses_cache(self):
+        payload = {"total_count": 0, "items": []}
+        ctx, session = _patch_session(_response(payload=payload))
+        with ctx:
+            github.github_search_repositories("q", limit=5)
+            github.github_search_repositories("q", limit=10)
+        assert session.request.call_count == 2
+
+    def test_errors_are_not_cached(self):
+        ctx, session = _patch_session(
+            _response(status=403, payload={"message": "rate limited"})
+        )
+        with ctx:
+            github.github_search_issues("q")
+            github.github_search_issues("q")
+        assert session.request.call_count == 2
+
+
+class TestFileShaCache:
+    def setup_method(self):
+        github._file_sha_cache.clear()
+
+    def test_cached_sha_skips_lookup(self):
+        github._file_sha_cache[("a/r", "", "f.txt")] = "oldsha"
+        put_resp = _response(
+            payload={"commit": {"sha": "c1"}, "content": {"sha": "newsha"}}
+        )
+        ctx, session = _patch_session(put_resp)
+        with ctx:
+            result = github.github_update_file("a/r", "f.txt", "data", "msg")
+        assert result["success"] is True
+        assert session.request.call_count == 1
+        _, kwargs = session.request.call_args
+        assert kwargs["json"]["sha"] == "oldsha"
+        assert github._file_sha_cache[("a/r", "", "f.txt")] == "newsha"
+
+    def test_stale_sha_refetches_and_retries(self):
+        github._file_sha_cache[("a/r", "", "f.txt")] = "stale"
+        conflict = _response(status=409, payload={"message": "sha mismatch"})
+        fresh = _response(payload={"sha": "fresh", "type": "file"})
+        done = _response(payload={"commit": {"sha": "c2"}, "content": {"sha": "s2"}})
+        session = MagicMock()
+        session.request.side_effect = [conflict, fresh, done]
+        with patch("ronnyx.tools.github._gh_session", return_value=session):
+            result = github.github_update_file("a/r", "f.txt", "data", "msg")
+        assert result["success"] is True
+        assert session.request.call_count == 3
+
+    def test_get_file_populates_cache(self):
+        import base64 as b64
+
+        payload = {
+            "type": "file",
+            "sha": "abc",
+            "content": b64.b64encode(b"hello").decode(),
+        }
+        ctx, _ = _patch_session(_response(payload=payload))
+        with ctx:
+            result = github.github_get_file("a/r", "f.txt")
+        assert result["content"] == "hello"
+        assert github._file_sha_cache[("a/r", "", "f.txt")] == "abc"
+
+
+class TestCreateFilesBatch:
+    def test_single_commit_for_many_files(self):
+        ref = _response(payload={"object": {"sha": "head"}})
+        parent = _response(payload={"tree": {"sha": "basetree"}})
+        tree = _response(payload={"sha": "newtree"})
+        commit = _response(payload={"sha": "newcommit"})
+        patched = _response(payload={"ref": "refs/heads/main"})
+        session = MagicMock()
+        session.request.side_effect = [ref, parent, tree, commit, patched]
+        files = [
+            {"path": "a.txt", "content": "A"},
+            {"path": "b.txt", "content": "B"},
+        ]
+        with patch("ronnyx.tools.github._gh_session", return_value=session):
+            result = github.github_create_files("a/r", files, "add two", branch="main")
+        assert result["success"] is True
+        assert result["commit"] == "newcommit"
+        assert result["files"] == ["a.txt", "b.txt"]
+        assert session.request.call_count == 5
+        _, kwargs = session.request.call_args_list[2]
+        assert kwargs["json"]["base_tree"] == "basetree"
+        assert len(kwargs["json"]["tree"]) == 2
+
+    def test_rejects_malformed_entries(self):
+        result = github.github_create_files("a/r", [{"path": "x"}], "msg", branch="m")
+        assert result["success"] is False
+
+    def test_empty_files_rejected(self):
+        result = github.github_create_files("a/r", [], "msg", branch="m")
+        assert result["success"] is False
+
+
+class TestGetIssuesBatch:
+    def test_single_graphql_post(self):
+        payload = {
+            "data": {
+                "repository": {
+                    "i1": {"number": 1, "state": "OPEN", "title": "a", "url": "u1"},
+                    "i2": {"number": 2, "state": "CLOSED", "title": "b", "url": "u2"},
+                }
+            }
+        }
+        ctx, session = _patch_session(_response(payload=payload))
+        with ctx:
+            result = github.github_get_issues_batch("a/r", [1, 2])
+        assert result["success"] is True
+        assert [i["number"] for i in result["issues"]] == [1, 2]
+        assert session.request.call_count == 1
+        args, kwargs = session.request.call_args
+        assert args[1].endswith("/graphql")
+        assert "i1: issue(number: 1)" in kwargs["json"]["query"]
+        assert kwargs["json"]["variables"] == {"owner": "a", "name": "r"}
+
+    def test_rejects_non_integer_numbers(self):
+        result = github.github_get_issues_batch("a/r", ["1; mutation"])
+        assert result["success"] is False
+
+    def test_rejects_repo_outside_name_alphabet(self):
+        ctx, session = _patch_session(_response(payload={}))
+        with ctx:
+            result = github.github_get_issues_batch(
+                'a/r") { id } } mutation { __typename', [1]
+            )
+        assert result["success"] is False
+        assert session.request.call_count == 0
+
+    def test_empty_numbers_rejected(self):
+        result = github.github_get_issues_batch("a/r", [])
+        assert result["success"] is False
+
+
+class TestListIssues:
+    def setup_method(self):
+        github._default_owner.cache_clear()
+        github._qualified.cache_clear()
+
+    def test_skips_pull_requests(self):
+        payload = [
+            {"number": 1, "title": "real", "state": "open", "user": {"login": "a"}},
+            {
+                "number": 2,
+                "title": "pr",
+                "state": "open",
+                "user": {"login": "a"},
+                "pull_request": {},
+            },
+        ]
+        ctx, _ = _patch_session(_response(payload=payload))
+        with ctx:
+            result = github.github_list_issues("a/r")
+        assert [i["number"] for i in result["issues"]] == [1]
+
+    def test_missing_owner(self):
+        with patch.dict(os.environ, {}, clear=True):
+            result = github.github_list_issues("repo")
+        assert result["success"] is False